@@ -0,0 +1,83 @@
+import statistics
+from collections import Counter
+from datetime import datetime
+from typing import Optional
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def compute_stats(messages: list[dict], threads: dict, top_n: int = 5) -> dict:
+    """Compute activity stats from fetched messages and their `group_threads` output.
+
+    Thread, depth and latency figures only cover messages that appear in `threads`,
+    so replies to messages outside the fetched window are left out, as in the thread output.
+    """
+    if not messages:
+        return {'message_count': 0}
+    times = {m['id']: datetime.strptime(m['timestamp'], TIMESTAMP_FORMAT) for m in messages}
+    span_hours = (max(times.values()) - min(times.values())).total_seconds() / 3600.0
+    hourly = Counter(t.hour for t in times.values())
+    posters = Counter(m['sender_id'] for m in messages if m['sender_id'] is not None)
+
+    replies_by_depth = Counter()
+    latencies = []
+    for thread in threads.values():
+        for m in thread:
+            if m['depth']:
+                replies_by_depth[m['depth']] += 1
+                latencies.append((times[m['id']] - times[m['reply_to']]).total_seconds())
+
+    if len(latencies) > 1:
+        p90 = statistics.quantiles(latencies, n=10, method='inclusive')[-1]
+    else:
+        p90 = latencies[0] if latencies else None
+
+    return {
+        'message_count': len(messages),
+        'span_hours': span_hours,
+        'messages_per_hour': len(messages) / max(span_hours, 1.0),
+        'hourly_counts': [hourly[h] for h in range(24)],
+        'top_posters': posters.most_common(top_n),
+        'thread_count': len(threads),
+        'replies_by_depth': dict(sorted(replies_by_depth.items())),
+        'reply_count': len(latencies),
+        'median_latency_s': statistics.median(latencies) if latencies else None,
+        'p90_latency_s': p90,
+    }
+
+
+def _format_duration(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return "n/a"
+    if seconds < 60:
+        return f"{seconds:.0f}s"
+    if seconds < 3600:
+        return f"{seconds / 60:.0f}m"
+    return f"{seconds / 3600:.1f}h"
+
+
+def format_stats_markdown(stats: dict, names: Optional[dict] = None) -> str:
+    """Render stats as a compact markdown section; `names` maps str(sender_id) to display name."""
+    names = names or {}
+    if not stats.get('message_count'):
+        return "## Activity stats\n\n*   No messages.\n"
+    busiest = max(range(24), key=lambda h: stats['hourly_counts'][h])
+    posters = ", ".join(
+        f"{names.get(str(sender_id), sender_id)} ({count})" for sender_id, count in stats['top_posters']
+    )
+    depths = ", ".join(f"{d}→{c}" for d, c in stats['replies_by_depth'].items())
+    threads_line = f"*   **Threads:** {stats['thread_count']}"
+    if depths:
+        threads_line += f", replies by depth: {depths}"
+    lines = [
+        "## Activity stats",
+        "",
+        f"*   **Messages:** {stats['message_count']} over {stats['span_hours']:.1f}h "
+        f"({stats['messages_per_hour']:.1f}/h), busiest hour {busiest:02d}:00 UTC "
+        f"({stats['hourly_counts'][busiest]} messages)",
+        f"*   **Top posters:** {posters or 'n/a'}",
+        threads_line,
+        f"*   **Response latency:** median {_format_duration(stats['median_latency_s'])}, "
+        f"p90 {_format_duration(stats['p90_latency_s'])} over {stats['reply_count']} replies",
+    ]
+    return "\n".join(lines) + "\n"
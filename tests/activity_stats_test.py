@@ -0,0 +1,50 @@
+import unittest
+from activity_stats import compute_stats, format_stats_markdown
+from thread_grouping import group_threads
+
+class TestActivityStats(unittest.TestCase):
+    def _messages(self):
+        return [
+            {'id': 1, 'sender_id': 100, 'reply_to': None, 'timestamp': '2024-01-01 10:00:00'},
+            {'id': 2, 'sender_id': 200, 'reply_to': 1, 'timestamp': '2024-01-01 10:01:00'},
+            {'id': 3, 'sender_id': 300, 'reply_to': 1, 'timestamp': '2024-01-01 10:02:00'},
+            {'id': 4, 'sender_id': 100, 'reply_to': 2, 'timestamp': '2024-01-01 10:03:00'},
+            {'id': 5, 'sender_id': 200, 'reply_to': None, 'timestamp': '2024-01-01 11:00:00'},
+            {'id': 6, 'sender_id': 200, 'reply_to': 5, 'timestamp': '2024-01-01 11:01:00'},
+        ]
+
+    def _stats(self, messages):
+        return compute_stats(messages, group_threads(messages))
+
+    def test_stats(self):
+        stats = self._stats(self._messages())
+        self.assertEqual(stats['message_count'], 6)
+        self.assertEqual(stats['thread_count'], 2)
+        self.assertEqual(stats['replies_by_depth'], {1: 3, 2: 1})
+        self.assertEqual(stats['top_posters'][0], (200, 3))
+        self.assertEqual(stats['hourly_counts'][10], 4)
+        self.assertEqual(stats['hourly_counts'][11], 2)
+        self.assertEqual(stats['reply_count'], 4)
+        self.assertEqual(stats['median_latency_s'], 90.0)
+
+    def test_reply_outside_fetched_window(self):
+        # Orphan replies are dropped by group_threads, so they count as neither threads nor replies
+        messages = [{'id': 10, 'sender_id': 1, 'reply_to': 3, 'timestamp': '2024-01-01 00:00:00'}]
+        stats = self._stats(messages)
+        self.assertEqual(stats['message_count'], 1)
+        self.assertEqual(stats['thread_count'], 0)
+        self.assertEqual(stats['replies_by_depth'], {})
+        self.assertIsNone(stats['median_latency_s'])
+
+    def test_markdown(self):
+        md = format_stats_markdown(self._stats(self._messages()), {'200': '@bob'})
+        self.assertIn("## Activity stats", md)
+        self.assertIn("@bob (3)", md)
+        self.assertIn("busiest hour 10:00 UTC", md)
+        self.assertIn("**Threads:** 2, replies by depth: 1→3, 2→1", md)
+
+    def test_empty(self):
+        self.assertIn("No messages", format_stats_markdown(compute_stats([], {})))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -10,6 +10,7 @@ from datetime import timezone
 import google.generativeai as genai
 from typing import Any, Optional
 from thread_grouping import group_threads
+from activity_stats import compute_stats, format_stats_markdown
 
 
 # These example values won't work. You must get your own api_id and
@@ -195,6 +196,7 @@ async def main_async(
             thread_lines.append(f"{indent}[{m['timestamp']}] {m['name']}: {m['text']}")
 
     thread_output = "\n".join(thread_lines)
+    stats_output = format_stats_markdown(compute_stats(messages, threads), user_cache)
     if not silent:
        print(thread_output)
 
@@ -207,6 +209,8 @@ async def main_async(
         out_filename = os.path.join(out_dir, f"{safe_group}_{date_str}.txt")
         with open(out_filename, "w", encoding="utf-8") as f:
             f.write(thread_output)
+            f.write("\n\n")
+            f.write(stats_output)
         summary_filename = os.path.join(out_dir, f"{safe_group}_{date_str}.md")
 
     # Summarize with Gemini if requested
@@ -224,6 +228,8 @@ async def main_async(
                 with open(summary_filename, "w", encoding="utf-8") as f:
                     f.write(f"# Summary for {group_name} ({date_str})\n\n")
                     f.write(summary)
+                    f.write("\n\n")
+                    f.write(stats_output)
                 created_md_files.append(summary_filename)
 
     # Save user cache and group info at the end